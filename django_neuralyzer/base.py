@@ -1,5 +1,4 @@
 from collections import OrderedDict
-import inspect
 from logging import getLogger
 
 from django.db.models import Q
@@ -150,30 +149,43 @@ class BaseNeuralyzer(object):
 
     @property
     def _excluded_attributes(self):
-        reserved_names = list(BaseNeuralyzer.__dict__.keys()) + ["Meta", "_declarations"]
-        return [
-            name
-            for name, value in inspect.getmembers_static(self)
-            if not name.startswith("__")
-            and name not in reserved_names
-            and value in [NEURALYZER_NOOP]
-        ]
+        return self._split_class_attributes()[1]
 
     def _get_class_attributes(self):
         """Return list of class attributes, which also includes methods and
         subclasses, ignoring any magic methods and reserved attributes
         as well as defined noop attributes
         """
-        reserved_names = list(BaseNeuralyzer.__dict__.keys()) + ["Meta", "_declarations"]
+        return self._split_class_attributes()[0]
 
-        return {
-            name: getattr(self, name)
-            for name, value in inspect.getmembers_static(self)
-            if not name.startswith("__")
-            and name not in reserved_names
-            and value not in [NEURALYZER_NOOP]
-        }
+    def _split_class_attributes(self):
+        """Return ``(declared, noop)`` where ``declared`` maps attribute names
+        to their value and ``noop`` lists attributes set to ``NEURALYZER_NOOP``,
+        in a single pass over the class members
+        """
+        # same static lookup as ``inspect.getmembers_static``: instance first,
+        # then the MRO, without resolving descriptors
+        members = {}
+        for namespace in [vars(self)] + [vars(klass) for klass in type(self).__mro__]:
+            for name, value in namespace.items():
+                if name not in members:
+                    members[name] = value
+
+        declared = {}
+        noop = []
+        for name in sorted(members):
+            if name.startswith("__") or name in RESERVED_NAMES:
+                continue
+            value = members[name]
+            if value in [NEURALYZER_NOOP]:
+                noop.append(name)
+            else:
+                declared[name] = getattr(self, name)
+        return declared, noop
 
     class Meta:
         noop = []
         onetoone = {}
+
+
+RESERVED_NAMES = frozenset(BaseNeuralyzer.__dict__) | {"Meta", "_declarations"}
@@ -0,0 +1,136 @@
+from django.apps import apps
+from django.db.models.fields.related import ManyToManyField
+from django.db.models.fields.related import OneToOneField
+
+from .base import NEURALYZER_NOOP
+from .base import BaseNeuralyzer
+from .base import LazyAttribute
+from .utils import get_app_submodules
+
+NOT_NEURALYZED = "__NOT_NEURALYZED__"
+UNDOCUMENTED = "__UNDOCUMENTED__"
+EMPTY = "__EMPTY__"
+
+
+def all_subclasses(cls):
+    return set(cls.__subclasses__()).union(
+        [s for c in cls.__subclasses__() for s in all_subclasses(c)]
+    )
+
+
+def get_neuralyzers(app_labels=None):
+    """Load every ``neuralyzers`` submodule and return a ``(neuralyzers, skipped)``
+    tuple of neuralyzer classes, both sorted by dotted path so that reports are
+    stable. ``neuralyzers`` are bound to a model, ``skipped`` are the ones without
+    ``Meta.model`` (abstract or misconfigured).
+
+    Args:
+      app_labels: optional iterable of app labels; only neuralyzers whose model
+        (or, for skipped ones, whose module) belongs to one of these apps are
+        returned. Raises ``LookupError`` for an unknown label.
+    """
+    if app_labels:
+        app_labels = {apps.get_app_config(label).label for label in app_labels}
+    else:
+        app_labels = None
+    # ensure neuralyzers has been loaded
+    list(get_app_submodules("neuralyzers"))
+
+    neuralyzers = []
+    skipped = []
+    for klass in all_subclasses(BaseNeuralyzer):
+        model = getattr(klass.Meta, "model", None)
+        if model is None:
+            app_config = apps.get_containing_app_config(klass.__module__)
+            app_label = app_config.label if app_config else None
+            target = skipped
+        else:
+            app_label = model._meta.app_label
+            target = neuralyzers
+        if app_labels is not None and app_label not in app_labels:
+            continue
+        target.append(klass)
+    return (
+        sorted(neuralyzers, key=get_neuralyzer_path),
+        sorted(skipped, key=get_neuralyzer_path),
+    )
+
+
+def get_neuralyzer_path(klass):
+    return f"{klass.__module__}.{klass.__qualname__}"
+
+
+def get_model_fields(model):
+    """Return concrete model fields a neuralyzer is expected to handle"""
+    return [
+        field
+        for field in model._meta.fields
+        if not isinstance(field, (ManyToManyField, OneToOneField))
+    ]
+
+
+class NeuralyzerIntrospection(object):
+    """Collect once what a neuralyzer declares and what its model defines, so
+    that coverage checks and exports are plain set lookups
+    """
+
+    def __init__(self, klass):
+        self.klass = klass
+        self.model = klass.Meta.model
+        self.neuralyzer = klass()
+        anon_fields, noop_fields = self.neuralyzer._split_class_attributes()
+        self.anon_fields = anon_fields
+        self.noop_fields = set(noop_fields)
+        self.model_fields = get_model_fields(self.model)
+        self.model_fields_names = {field.name for field in self.model._meta.fields}
+
+    def is_handled(self, field):
+        return field.name in self.anon_fields or field.name in self.noop_fields
+
+    @property
+    def missing_fields(self):
+        return [field.name for field in self.model_fields if not self.is_handled(field)]
+
+    @property
+    def extra_fields(self):
+        return [name for name in self.anon_fields if name not in self.model_fields_names]
+
+    def report(self):
+        return {
+            "neuralyzer": get_neuralyzer_path(self.klass),
+            "model": self.model._meta.label,
+            "missing": self.missing_fields,
+            "extra": self.extra_fields,
+        }
+
+    def describe(self, field):
+        """Return ``(neuralyzed_to, dynamic)`` documenting how ``field`` is
+        neuralyzed
+        """
+        if not self.is_handled(field):
+            return NOT_NEURALYZED, "?"
+
+        neuralyzed_op = self.anon_fields.get(field.name, NEURALYZER_NOOP)
+        if callable(neuralyzed_op):
+            func = neuralyzed_op
+            if isinstance(neuralyzed_op, LazyAttribute):
+                func = neuralyzed_op.lazy_fn
+            return func.__doc__ or UNDOCUMENTED, True
+        if neuralyzed_op in ["", [], {}, None]:
+            return EMPTY, False
+        return neuralyzed_op, False
+
+    def iter_rows(self):
+        neuralyzer_path = get_neuralyzer_path(self.klass)
+        model_verbose_name = str(self.model._meta.verbose_name)
+        for field in self.model_fields:
+            neuralyzed_to, dynamic = self.describe(field)
+            yield {
+                "neuralyzer": neuralyzer_path,
+                "model": model_verbose_name,
+                "field_name": field.name,
+                "verbose_name": str(field.verbose_name),
+                "help_text": str(field.help_text),
+                "neuralyzed_to": neuralyzed_to,
+                "dynamic": dynamic,
+            }
@@ -1,57 +1,89 @@
+import json
 import logging
 import sys
 
 from django.core.management.base import BaseCommand
-from django.db.models.fields.related import ManyToManyField
-from django.db.models.fields.related import OneToOneField
-
-from django_neuralyzer.base import BaseNeuralyzer
-from django_neuralyzer.utils import get_app_submodules
-
-
-def all_subclasses(cls):
-    return set(cls.__subclasses__()).union(
-        [s for c in cls.__subclasses__() for s in all_subclasses(c)]
-    )
+from django.core.management.base import CommandError
 
+from django_neuralyzer.introspection import NeuralyzerIntrospection
+from django_neuralyzer.introspection import get_neuralyzer_path
+from django_neuralyzer.introspection import get_neuralyzers
+from django_neuralyzer.utils import open_output
 
 logger = logging.getLogger(__name__)
 
 
 class Command(BaseCommand):
-    help = ""
+    help = "Ensure every model field is handled by its neuralyzer"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--app",
+            action="append",
+            dest="app_labels",
+            metavar="APP_LABEL",
+            help="Only check neuralyzers of models from this app (can be repeated)",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["text", "json"],
+            default="text",
+            help="Report format (default: text)",
+        )
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="Write the report to this path instead of standard output",
+        )
 
     def handle(self, *args, **options):
-        # ensure neuralyzers has been loaded
-        list(get_app_submodules("neuralyzers"))
-        # get all subclasses
-        anon_classes = all_subclasses(BaseNeuralyzer)
+        try:
+            neuralyzers, skipped = get_neuralyzers(options["app_labels"])
+        except LookupError as e:
+            raise CommandError(e)
+        skipped = [get_neuralyzer_path(klass) for klass in skipped]
+        reports = []
         errors = []
 
-        for klass in anon_classes:
-            print(f"Neuralyzer: {klass}")
-            model = klass.Meta.model
-            neuralyzer = klass()
-            anon_fields = neuralyzer._get_class_attributes()
-            noop_fields = neuralyzer._excluded_attributes
-            model_fields = model._meta.fields
-            model_fields_names = [field.name for field in model_fields]
-            for field in model_fields:
-                if isinstance(field, (ManyToManyField, OneToOneField)):
-                    continue
-
-                if field.name not in anon_fields and field.name not in noop_fields:
-                    errors.append(
-                        f"Neuralyzer {klass.__name__} is missing field {field.name} for model {model.__name__}"
-                    )
-            for field in anon_fields:
-                if field not in model_fields_names:
-                    errors.append(
-                        f"Neuralyzer {klass.__name__} has extra field {field} for model {model.__name__}"
-                    )
+        for klass in neuralyzers:
+            report = NeuralyzerIntrospection(klass).report()
+            reports.append(report)
+            for field_name in report["missing"]:
+                errors.append(
+                    f"Neuralyzer {klass.__name__} is missing field {field_name}"
+                    f" for model {klass.Meta.model.__name__}"
+                )
+            for field_name in report["extra"]:
+                errors.append(
+                    f"Neuralyzer {klass.__name__} has extra field {field_name}"
+                    f" for model {klass.Meta.model.__name__}"
+                )
+
+        with open_output(options["output"], self.stdout) as output:
+            if options["format"] == "json":
+                self.write_json(output, reports, skipped, errors)
+            else:
+                self.write_text(output, reports, skipped, errors)
 
         if errors:
-            print("Following models have not been fully handled: \n" + "\n".join(errors))
             sys.exit(1)
+
+    def write_text(self, output, reports, skipped, errors):
+        for report in reports:
+            output.write(f"Neuralyzer: {report['neuralyzer']}\n")
+        for path in skipped:
+            output.write(f"Skipped neuralyzer without Meta.model: {path}\n")
+        if errors:
+            output.write("Following models have not been fully handled: \n")
+            output.write("\n".join(errors) + "\n")
         else:
-            print("All models neuralyzed include all fields!")
+            output.write("All models neuralyzed include all fields!\n")
+
+    def write_json(self, output, reports, skipped, errors):
+        report = {
+            "success": not errors,
+            "errors": errors,
+            "neuralyzers": reports,
+            "skipped": skipped,
+        }
+        output.write(json.dumps(report, indent=2) + "\n")
@@ -1,93 +1,88 @@
 import csv
+import json
 import logging
 
 from django.core.management.base import BaseCommand
-from django.db.models.fields.related import ManyToManyField
-from django.db.models.fields.related import OneToOneField
-
-from django_neuralyzer.base import BaseNeuralyzer
-from django_neuralyzer.base import LazyAttribute
-from django_neuralyzer.utils import get_app_submodules
-
-
-def all_subclasses(cls):
-    return set(cls.__subclasses__()).union(
-        [s for c in cls.__subclasses__() for s in all_subclasses(c)]
-    )
+from django.core.management.base import CommandError
 
+from django_neuralyzer.introspection import NeuralyzerIntrospection
+from django_neuralyzer.introspection import get_neuralyzer_path
+from django_neuralyzer.introspection import get_neuralyzers
+from django_neuralyzer.utils import open_output
 
 logger = logging.getLogger(__name__)
 
+FIELDNAMES = [
+    "neuralyzer",
+    "model",
+    "field_name",
+    "verbose_name",
+    "help_text",
+    "neuralyzed_to",
+    "dynamic",
+]
+
 
 class Command(BaseCommand):
     help = "Export all neuralyzed fields with their neuralized value"
 
-    def handle(self, *args, **options):
-        # ensure neuralyzers has been loaded
-        list(get_app_submodules("neuralyzers"))
-        # get all subclasses
-        anon_classes = all_subclasses(BaseNeuralyzer)
-        # errors = []
-        data = {}
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--app",
+            action="append",
+            dest="app_labels",
+            metavar="APP_LABEL",
+            help="Only export neuralyzers of models from this app (can be repeated)",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["csv", "json"],
+            default="csv",
+            help="Export format (default: csv)",
+        )
+        parser.add_argument(
+            "--output",
+            help="Path of the export, '-' for standard output"
+            " (default: neuralyzer_export.<format>)",
+        )
 
-        for klass in anon_classes:
-            model = klass.Meta.model
-            neuralyzer = klass()
-            anon_fields = neuralyzer._get_class_attributes()
-            noop_fields = neuralyzer._excluded_attributes
-            model_fields = model._meta.fields
-            # model_fields_names = [field.name for field in model_fields]
-            data[klass] = []
-            for field in model_fields:
-                if isinstance(field, (ManyToManyField, OneToOneField)):
-                    continue
+    def handle(self, *args, **options):
+        try:
+            neuralyzers, skipped = get_neuralyzers(options["app_labels"])
+        except LookupError as e:
+            raise CommandError(e)
+        for klass in skipped:
+            self.stderr.write(
+                f"Skipped neuralyzer without Meta.model: {get_neuralyzer_path(klass)}"
+            )
+        output_path = options["output"] or f"neuralyzer_export.{options['format']}"
+        rows = self.iter_rows(neuralyzers)
 
-                if field.name not in anon_fields and field.name not in noop_fields:
-                    data[klass].append(
-                        {"field": field, "neuralyzed_to": "__NOT_NEURALYZED__", "dynamic": "?"}
-                    )
-                    continue
+        with open_output(output_path, self.stdout) as output:
+            if options["format"] == "json":
+                self.to_json(output, rows)
+            else:
+                self.to_csv(output, rows)
 
-                neuralyzed_op = getattr(neuralyzer, field.name)
-                if callable(neuralyzed_op):
-                    func = neuralyzed_op
-                    if isinstance(neuralyzed_op, LazyAttribute):
-                        func = neuralyzed_op.lazy_fn
-                    neuralyzed_data = func.__doc__ or "__UNDOCUMENTED__"
-                    dynamic = True
-                elif neuralyzed_op in ["", [], {}, None]:
-                    neuralyzed_data = "__EMPTY__"
-                    dynamic = False
-                else:
-                    neuralyzed_data = neuralyzed_op
-                    dynamic = False
-                data[klass].append(
-                    {"field": field, "neuralyzed_to": neuralyzed_data, "dynamic": dynamic}
-                )
+    def iter_rows(self, neuralyzers):
+        for klass in neuralyzers:
+            yield from NeuralyzerIntrospection(klass).iter_rows()
 
-        self.to_csv(data)
+    def to_csv(self, output, rows):
+        writer = csv.DictWriter(output, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
 
-    def to_csv(self, data):
-        fieldnames = [
-            "model",
-            "field_name",
-            "verbose_name",
-            "help_text",
-            "neuralyzed_to",
-            "dynamic",
-        ]
-        with open("neuralyzer_export.csv", "w", newline="") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for neuralyzer, fields in data.items():
-                for field in fields:
-                    writer.writerow(
-                        dict(
-                            model=neuralyzer.Meta.model._meta.verbose_name,
-                            field_name=field["field"].name,
-                            verbose_name=field["field"].verbose_name,
-                            help_text=field["field"].help_text,
-                            neuralyzed_to=field["neuralyzed_to"],
-                            dynamic=field["dynamic"],
-                        )
-                    )
+    def to_json(self, output, rows):
+        # rows are written one per line as they are produced, holding back the
+        # previous one to know whether a separator is needed
+        output.write("[\n")
+        previous = None
+        for row in rows:
+            if previous is not None:
+                output.write(f"  {previous},\n")
+            previous = json.dumps(row, default=str)
+        if previous is not None:
+            output.write(f"  {previous}\n")
+        output.write("]\n")
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from importlib import import_module
 
 from django.apps import apps
@@ -29,3 +30,15 @@ def get_app_submodules(submodule_name):
     for name, module in get_app_modules():
         if module_has_submodule(module, submodule_name):
             yield name, import_module(f"{name}.{submodule_name}")
+
+
+@contextmanager
+def open_output(path, stdout):
+    """
+    Open ``path`` for writing, or yield ``stdout`` when path is ``-``
+    """
+    if path == "-":
+        yield stdout
+        return
+    with open(path, "w", newline="") as output:
+        yield output
@@ -0,0 +1,22 @@
+from django_neuralyzer.base import NEURALYZER_NOOP
+from django_neuralyzer.base import BaseNeuralyzer
+from django_neuralyzer.base import lazy_attribute
+
+from . import models
+
+
+class PersonNeuralyzer(BaseNeuralyzer):
+    id = NEURALYZER_NOOP
+    first_name = "John"
+    last_name = lazy_attribute(lambda o: "x" * len(o.last_name))
+    line1 = ""
+    line2 = ""
+    line3 = NEURALYZER_NOOP
+
+    @lazy_attribute
+    def raw_data(self):
+        """Empty JSON object"""
+        return "{}"
+
+    class Meta:
+        model = models.Person
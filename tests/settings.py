@@ -1,4 +1,4 @@
-INSTALLED_APPS = ["tests"]
+INSTALLED_APPS = ["django_neuralyzer", "tests"]
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -0,0 +1,254 @@
+import csv
+import gc
+from io import StringIO
+import json
+import os
+import tempfile
+import time
+from unittest import mock
+
+from django.core.management import CommandError
+from django.core.management import call_command
+from django.test import TestCase
+
+from django_neuralyzer.base import BaseNeuralyzer
+
+from . import models
+from .neuralyzers import PersonNeuralyzer
+
+
+def patch_neuralyzers(*neuralyzers):
+    """Only expose ``neuralyzers`` to the commands, instead of every subclass of
+    ``BaseNeuralyzer`` still alive in the test process
+    """
+    return mock.patch(
+        "django_neuralyzer.introspection.all_subclasses", return_value=set(neuralyzers)
+    )
+
+
+class EnsureFieldsAreHandledTestCase(TestCase):
+    def run_command(self, *args):
+        """Return ``(exit_code, stdout)``"""
+        stdout = StringIO()
+        try:
+            call_command("ensure_fields_are_handled", *args, stdout=stdout)
+        except SystemExit as e:
+            return e.code, stdout.getvalue()
+        return 0, stdout.getvalue()
+
+    def get_report(self, *args):
+        code, output = self.run_command("--format=json", *args)
+        return code, json.loads(output)
+
+    @patch_neuralyzers(PersonNeuralyzer)
+    def test_fully_handled(self, _):
+        code, report = self.get_report("--app=tests")
+        self.assertEqual(code, 0)
+        self.assertEqual(
+            report,
+            {
+                "success": True,
+                "errors": [],
+                "neuralyzers": [
+                    {
+                        "neuralyzer": "tests.neuralyzers.PersonNeuralyzer",
+                        "model": "tests.Person",
+                        "missing": [],
+                        "extra": [],
+                    }
+                ],
+                "skipped": [],
+            },
+        )
+
+    def test_missing_and_extra_fields(self):
+        class IncompleteNeuralyzer(BaseNeuralyzer):
+            first_name = "John"
+            nickname = "Johnny"
+
+            class Meta:
+                model = models.Person
+
+        with patch_neuralyzers(PersonNeuralyzer, IncompleteNeuralyzer):
+            code, _ = self.run_command()
+            self.assertEqual(code, 1)
+
+            with tempfile.TemporaryDirectory() as tmpdir:
+                path = os.path.join(tmpdir, "report.json")
+                code, _ = self.run_command("--format=json", f"--output={path}")
+                with open(path) as output:
+                    report = json.load(output)
+
+        self.assertEqual(code, 1)
+        self.assertFalse(report["success"])
+        self.assertEqual(
+            report["errors"],
+            [
+                f"Neuralyzer IncompleteNeuralyzer is missing field {name} for model Person"
+                for name in ["id", "last_name", "line1", "line2", "line3", "raw_data"]
+            ]
+            + ["Neuralyzer IncompleteNeuralyzer has extra field nickname for model Person"],
+        )
+        person_entry, entry = report["neuralyzers"]
+        self.assertEqual(person_entry["neuralyzer"], "tests.neuralyzers.PersonNeuralyzer")
+        self.assertEqual(entry["neuralyzer"], f"{__name__}.{IncompleteNeuralyzer.__qualname__}")
+        self.assertEqual(
+            entry["missing"], ["id", "last_name", "line1", "line2", "line3", "raw_data"]
+        )
+        self.assertEqual(entry["extra"], ["nickname"])
+
+    def test_skipped(self):
+        class ModellessNeuralyzer(BaseNeuralyzer):
+            first_name = "John"
+
+        with patch_neuralyzers(PersonNeuralyzer, ModellessNeuralyzer):
+            code, report = self.get_report()
+            _, output = self.run_command()
+
+        path = f"{__name__}.{ModellessNeuralyzer.__qualname__}"
+        self.assertEqual(code, 0)
+        self.assertEqual(report["skipped"], [path])
+        self.assertIn(f"Skipped neuralyzer without Meta.model: {path}", output)
+
+    @patch_neuralyzers(PersonNeuralyzer)
+    def test_app_filter(self, _):
+        code, report = self.get_report("--app=django_neuralyzer")
+        self.assertEqual(code, 0)
+        self.assertEqual(report["neuralyzers"], [])
+        self.assertTrue(report["success"])
+
+    def test_unknown_app(self):
+        with self.assertRaisesMessage(CommandError, "nope"):
+            call_command("ensure_fields_are_handled", "--app=nope", stdout=StringIO())
+
+    def test_many_neuralyzers(self):
+        declarations = {
+            name: value
+            for name, value in vars(PersonNeuralyzer).items()
+            if not name.startswith("__")
+        }
+        neuralyzers = [
+            type(f"PersonNeuralyzer{i}", (BaseNeuralyzer,), dict(declarations))
+            for i in range(500)
+        ]
+
+        with patch_neuralyzers(*neuralyzers):
+            start = time.perf_counter()
+            code, report = self.get_report()
+            duration = time.perf_counter() - start
+
+        self.assertEqual(code, 0)
+        self.assertEqual(len(report["neuralyzers"]), 500)
+        self.assertLess(duration, 1)
+
+
+@patch_neuralyzers(PersonNeuralyzer)
+class ExportNeuralyzedFieldsTestCase(TestCase):
+    def export(self, *args):
+        stdout = StringIO()
+        call_command("export_neuralyzed_fields", "--output=-", "--app=tests", *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def get_person_rows(self, rows):
+        return {
+            row["field_name"]: row
+            for row in rows
+            if row["neuralyzer"] == "tests.neuralyzers.PersonNeuralyzer"
+        }
+
+    def test_csv(self, _):
+        rows = self.get_person_rows(csv.DictReader(StringIO(self.export())))
+        self.assertEqual(rows["first_name"]["neuralyzed_to"], "John")
+        self.assertEqual(rows["first_name"]["dynamic"], "False")
+        self.assertEqual(rows["raw_data"]["neuralyzed_to"], "Empty JSON object")
+        self.assertEqual(rows["raw_data"]["dynamic"], "True")
+
+    def test_json(self, _):
+        rows = self.get_person_rows(json.loads(self.export("--format=json")))
+        self.assertEqual(rows["line1"]["neuralyzed_to"], "__EMPTY__")
+        self.assertEqual(rows["last_name"]["neuralyzed_to"], "__UNDOCUMENTED__")
+        self.assertIs(rows["last_name"]["dynamic"], True)
+        self.assertEqual(rows["line3"]["neuralyzed_to"], "__NOOP__")
+
+    def test_output_path(self, _):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "export.json")
+            call_command("export_neuralyzed_fields", "--format=json", f"--output={path}")
+            with open(path) as export:
+                self.assertTrue(json.load(export))
+
+    def test_unknown_app(self, _):
+        with self.assertRaisesMessage(CommandError, "nope"):
+            call_command("export_neuralyzed_fields", "--app=nope", "--output=-", stdout=StringIO())
+
+    def test_skipped(self, _):
+        class ModellessNeuralyzer(BaseNeuralyzer):
+            first_name = "John"
+
+        stdout = StringIO()
+        stderr = StringIO()
+        with patch_neuralyzers(PersonNeuralyzer, ModellessNeuralyzer):
+            call_command(
+                "export_neuralyzed_fields",
+                "--format=json",
+                "--output=-",
+                stdout=stdout,
+                stderr=stderr,
+            )
+
+        self.assertEqual(len(json.loads(stdout.getvalue())), 7)
+        self.assertEqual(
+            stderr.getvalue(),
+            "Skipped neuralyzer without Meta.model:"
+            f" {__name__}.{ModellessNeuralyzer.__qualname__}\n",
+        )
+
+
+class DiscoveryTestCase(TestCase):
+    """Run the commands without patching, so neuralyzers are found by loading
+    ``neuralyzers`` submodules and walking ``BaseNeuralyzer`` subclasses
+    """
+
+    def setUp(self):
+        # drop neuralyzers declared inside previous tests
+        gc.collect()
+
+    def get_report(self, *args):
+        stdout = StringIO()
+        try:
+            call_command("ensure_fields_are_handled", "--format=json", *args, stdout=stdout)
+        except SystemExit as e:
+            return e.code, json.loads(stdout.getvalue())
+        return 0, json.loads(stdout.getvalue())
+
+    def test_ensure_fields_are_handled(self):
+        code, report = self.get_report("--app=tests")
+        self.assertEqual(code, 0)
+        self.assertEqual(report["errors"], [])
+        self.assertEqual(
+            [entry["neuralyzer"] for entry in report["neuralyzers"]],
+            ["tests.neuralyzers.PersonNeuralyzer"],
+        )
+        # abstract base declared in tests/test_base.py
+        self.assertEqual(report["skipped"], ["tests.test_base.BaseNeuralyzer"])
+
+    def test_app_filter(self):
+        code, report = self.get_report("--app=django_neuralyzer")
+        self.assertEqual(code, 0)
+        self.assertEqual(report["neuralyzers"], [])
+        self.assertEqual(report["skipped"], [])
+
+    def test_export_neuralyzed_fields(self):
+        stdout = StringIO()
+        call_command(
+            "export_neuralyzed_fields",
+            "--app=tests",
+            "--format=json",
+            "--output=-",
+            stdout=stdout,
+            stderr=StringIO(),
+        )
+        self.assertEqual(
+            {row["neuralyzer"] for row in json.loads(stdout.getvalue())},
+            {"tests.neuralyzers.PersonNeuralyzer"},
+        )